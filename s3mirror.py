@@ -13,22 +13,44 @@ Features:
 """
 
 import argparse
+import collections
+import copy
+import itertools
 import json
 import logging
+import queue
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Callable,
+    Counter,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import boto3
 import botocore
 import urllib3
 import yaml
-from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
+# Prefer the libyaml-backed loader; PyYAML builds without it fall back to the
+# pure-Python one.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # ==========================================
 # DEFAULT CONFIGURATION
 # ==========================================
@@ -50,18 +72,125 @@ DEFAULT_CONFIG = {
     },
     "performance": {
         "max_workers": 20,
+        "bucket_workers": 4,
+        "list_shards": 16,
         "multipart_threshold": 8_388_608,  # 8MB
         "multipart_chunksize": 8_388_608,  # 8MB
         "max_concurrency": 10,
         "max_pool_connections": 50,
+        "connect_timeout": 10,
+        "read_timeout": 60,
+        "adaptive_concurrency": True,
     },
     "sync": {
         "delete_extraneous": True,
         "exclude_buckets": [],
+        "compare_etags": True,
+        "compare_checksums": True,
     },
 }
 
 
+# Listing entry for one object:
+# (key, size, etag, checksum algorithms, checksum type).
+ListingEntry = Tuple[str, int, str, Tuple[str, ...], str]
+
+# Object to copy: (key, size, etag). The listed ETag pins every ranged read of
+# a multipart copy to the same version of the source object.
+CopyItem = Tuple[str, int, str]
+
+# S3 rejects multipart uploads with more parts than this, so larger objects
+# get proportionally larger parts than the configured chunk size.
+MAX_MULTIPART_PARTS = 10_000
+
+# S3 rejects every part but the last below this size with EntityTooSmall, so
+# smaller configured chunk sizes are raised to it.
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+# Large bucket listings are split into key ranges starting at these characters
+# when the bucket has no usable "/" prefixes to split on.
+SHARD_ALPHABET = "0123456789abcdef"
+SHARD_PROBE_DEPTH = 3
+
+# DeleteObjects accepts at most this many keys per request.
+DELETE_BATCH_SIZE = 1000
+
+
+# Responses that mean the endpoint wants fewer requests. THROTTLE_THRESHOLD of
+# them within THROTTLE_WINDOW seconds halve the number of S3 requests in flight,
+# cutting the limit to no less than a quarter in one step and at most once per
+# THROTTLE_WINDOW. It then grows back by one per THROTTLE_RECOVERY seconds
+# without throttling.
+THROTTLE_ERROR_CODES = {"SlowDown", "ServiceUnavailable", "503"}
+THROTTLE_WINDOW = 10.0
+THROTTLE_THRESHOLD = 5
+THROTTLE_RECOVERY = 5.0
+
+
+class ListingOrderError(Exception):
+    """A listing returned keys out of lexicographic order."""
+
+
+class AdaptiveLimiter:
+    """Concurrency limit with additive-increase, multiplicative-decrease."""
+
+    def __init__(self, limit: int):
+        self.max_limit = limit
+        self.limit = limit
+        self._in_use = 0
+        self._throttles: Deque[float] = collections.deque()
+        self._last_change = time.monotonic()
+        self._last_cut = float("-inf")
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self._in_use >= self.limit:
+                self._cond.wait()
+            self._in_use += 1
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        with self._cond:
+            self._in_use -= 1
+            now = time.monotonic()
+            self._expire(now)
+            if (
+                self.limit < self.max_limit
+                and not self._throttles
+                and now - self._last_change >= THROTTLE_RECOVERY
+            ):
+                self.limit += 1
+                self._last_change = now
+            self._cond.notify()
+
+    def _expire(self, now: float) -> None:
+        while self._throttles and now - self._throttles[0] > THROTTLE_WINDOW:
+            self._throttles.popleft()
+
+    def throttled(self) -> bool:
+        """Record a throttling response, returning True if the limit was cut."""
+        with self._cond:
+            now = time.monotonic()
+            self._throttles.append(now)
+            self._expire(now)
+            if (
+                len(self._throttles) < THROTTLE_THRESHOLD
+                or self.limit == 1
+                or now - self._last_cut < THROTTLE_WINDOW
+            ):
+                return False
+            # Halve the requests in flight so the cut takes effect at once, but
+            # count fewer than half the limit as half: a burst while only a few
+            # requests run must not serialize the rest of the run.
+            in_flight = max(min(self.limit, self._in_use), self.limit // 2)
+            self.limit = max(1, in_flight // 2)
+            self._throttles.clear()
+            self._last_change = now
+            self._last_cut = now
+            return True
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
 
@@ -96,27 +225,82 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
         self.multipart_threshold = perf["multipart_threshold"]
         self.multipart_chunksize = perf["multipart_chunksize"]
         self.max_concurrency = perf["max_concurrency"]
-        self.max_pool_connections = perf["max_pool_connections"]
+        self.bucket_workers = perf["bucket_workers"]
+        self.list_shards = perf["list_shards"]
+        if self.list_shards < 1:
+            raise ValueError(
+                f"performance.list_shards must be at least 1, got {self.list_shards}"
+            )
+        self.connect_timeout = perf["connect_timeout"]
+        self.read_timeout = perf["read_timeout"]
+
+        # Multipart parts of every object share one pool, so the number of
+        # part buffers held in memory stays at one per object worker rather
+        # than growing with max_concurrency on top of it.
+        self.part_workers = self.bucket_workers * self.max_workers
+        self._part_executor = ThreadPoolExecutor(
+            max_workers=self.part_workers, thread_name_prefix="part"
+        )
+
+        # Every object worker, part thread and listing shard may hold a
+        # connection, so a smaller pool would discard and re-handshake them.
+        self.max_pool_connections = max(
+            perf["max_pool_connections"],
+            self.bucket_workers * (self.max_workers + self.list_shards)
+            + self.part_workers,
+        )
 
         self.delete_extraneous = config["sync"]["delete_extraneous"]
         self.exclude_buckets = set(config["sync"]["exclude_buckets"])
+        self._dest_buckets: Set[str] = set()
+        self.compare_etags = config["sync"]["compare_etags"]
+        self.compare_checksums = config["sync"]["compare_checksums"]
+
+        # The limiter counts individual S3 requests. It starts at the pool
+        # size, which already covers every thread that can issue one.
+        self.adaptive_concurrency = perf["adaptive_concurrency"]
+        self._limiter = AdaptiveLimiter(self.max_pool_connections)
+
+        self._log_settings()
+
+        # One session loads config files and the S3 service model once and
+        # shares them between both clients.
+        self._boto_session = boto3.session.Session()
+        self.source_client = self._create_client(config["source"], "SOURCE")
+        self.dest_client = self._create_client(config["destination"], "DESTINATION")
 
+        self.stats = {
+            "buckets_processed": 0,
+            "buckets_created": 0,
+            "buckets_skipped": 0,
+            "objects_copied": 0,
+            "objects_deleted": 0,
+            "bytes_transferred": 0,
+            "errors": 0,
+            "start_time": time.time(),
+        }
+        self._stats_lock = threading.Lock()
+
+    def _log_settings(self) -> None:
+        """Log the effective settings at debug level."""
         self.logger.debug("=" * 70)
         self.logger.debug("INITIALIZATION")
         self.logger.debug("=" * 70)
-        self.logger.debug("Source endpoint: %s", config["source"]["endpoint_url"])
+        self.logger.debug("Source endpoint: %s", self.config["source"]["endpoint_url"])
         self.logger.debug(
-            "Source access key: %s", config["source"]["aws_access_key_id"]
+            "Source access key: %s", self.config["source"]["aws_access_key_id"]
         )
         self.logger.debug(
             "Destination endpoint: %s",
-            config["destination"]["endpoint_url"],
+            self.config["destination"]["endpoint_url"],
         )
         self.logger.debug(
             "Destination access key: %s",
-            config["destination"]["aws_access_key_id"],
+            self.config["destination"]["aws_access_key_id"],
         )
         self.logger.debug("Max workers: %d", self.max_workers)
+        self.logger.debug("Bucket workers: %d", self.bucket_workers)
+        self.logger.debug("Listing shards: %d", self.list_shards)
         self.logger.debug(
             "Multipart threshold: %s", self._format_bytes(self.multipart_threshold)
         )
@@ -124,23 +308,22 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
             "Multipart chunk size: %s", self._format_bytes(self.multipart_chunksize)
         )
         self.logger.debug("Max concurrency: %d", self.max_concurrency)
+        self.logger.debug("Part workers: %d", self.part_workers)
         self.logger.debug("Connection pool: %d", self.max_pool_connections)
+        self.logger.debug(
+            "Timeouts: connect %ds, read %ds", self.connect_timeout, self.read_timeout
+        )
+        self.logger.debug("Adaptive concurrency: %s", self.adaptive_concurrency)
         self.logger.debug("Delete extraneous: %s", self.delete_extraneous)
+        self.logger.debug("Compare ETags: %s", self.compare_etags)
+        self.logger.debug("Compare checksums: %s", self.compare_checksums)
         self.logger.debug("")
 
-        self.source_client = self._create_client(config["source"], "SOURCE")
-        self.dest_client = self._create_client(config["destination"], "DESTINATION")
-
-        self.stats = {
-            "buckets_processed": 0,
-            "buckets_created": 0,
-            "buckets_skipped": 0,
-            "objects_copied": 0,
-            "objects_deleted": 0,
-            "bytes_transferred": 0,
-            "errors": 0,
-            "start_time": time.time(),
-        }
+    def _record(self, **counts: int) -> None:
+        """Add counts to the run statistics; safe to call from any thread."""
+        with self._stats_lock:
+            for name, value in counts.items():
+                self.stats[name] += value
 
     def _create_client(self, endpoint_config: dict, label: str):
         boto_config = Config(
@@ -149,11 +332,13 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
             max_pool_connections=self.max_pool_connections,
             retries={"max_attempts": 3, "mode": "adaptive"},
             tcp_keepalive=True,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
         )
 
         self.logger.debug("Creating %s client...", label)
 
-        return boto3.client(
+        client = self._boto_session.client(
             "s3",
             endpoint_url=endpoint_config["endpoint_url"],
             aws_access_key_id=endpoint_config["aws_access_key_id"],
@@ -162,6 +347,26 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
             verify=endpoint_config.get("verify_ssl", False),
             config=boto_config,
         )
+        if self.adaptive_concurrency:
+            client.meta.events.register("needs-retry.s3", self._check_throttle)
+        return client
+
+    def _check_throttle(self, response=None, **_kwargs) -> None:
+        """Report throttling responses seen by botocore's retry check."""
+        if response is None:
+            return
+        http_response, parsed = response
+        code = parsed.get("Error", {}).get("Code")
+        if http_response.status_code == 503 or code in THROTTLE_ERROR_CODES:
+            if self._limiter.throttled():
+                self.logger.warning(
+                    "  ⚠ Endpoint is throttling, request concurrency reduced to %d",
+                    self._limiter.limit,
+                )
+
+    def _request_slot(self):
+        """Return a context holding one adaptive concurrency slot, if enabled."""
+        return self._limiter if self.adaptive_concurrency else nullcontext()
 
     def verify_connections(self) -> bool:
         """Test connectivity to both endpoints."""
@@ -172,7 +377,8 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
         # Test source
         self.logger.debug("Testing SOURCE: %s", self.config["source"]["endpoint_url"])
         try:
-            response = self.source_client.list_buckets()
+            with self._request_slot():
+                response = self.source_client.list_buckets()
             bucket_count = len(response["Buckets"])
             self.logger.info(
                 "✓ Source connected successfully (%d buckets)", bucket_count
@@ -181,8 +387,10 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
                 "  Response metadata: %s",
                 response["ResponseMetadata"]["HTTPStatusCode"],
             )
-            if bucket_count > 0:
-                bucket_names = [b["Name"] for b in response["Buckets"][:5]]
+            if bucket_count > 0 and self.logger.isEnabledFor(logging.DEBUG):
+                bucket_names = [
+                    b["Name"] for b in itertools.islice(response["Buckets"], 5)
+                ]
                 self.logger.debug("  Sample buckets: %s", ", ".join(bucket_names))
                 if bucket_count > 5:
                     self.logger.debug("  ... and %d more", bucket_count - 5)
@@ -204,8 +412,10 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
             "Testing DESTINATION: %s", self.config["destination"]["endpoint_url"]
         )
         try:
-            response = self.dest_client.list_buckets()
+            with self._request_slot():
+                response = self.dest_client.list_buckets()
             bucket_count = len(response["Buckets"])
+            self._dest_buckets = {b["Name"] for b in response["Buckets"]}
             self.logger.info(
                 "✓ Destination connected successfully (%d buckets)", bucket_count
             )
@@ -232,7 +442,8 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
     def get_source_buckets(self) -> List[str]:
         """Retrieve list of bucket names from source."""
         try:
-            response = self.source_client.list_buckets()
+            with self._request_slot():
+                response = self.source_client.list_buckets()
             all_buckets = [b["Name"] for b in response["Buckets"]]
 
             buckets = [b for b in all_buckets if b not in self.exclude_buckets]
@@ -253,8 +464,12 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
 
     def bucket_exists(self, bucket_name: str) -> bool:
         """Check if bucket exists on destination."""
+        if bucket_name in self._dest_buckets:
+            return True
+
         try:
-            self.dest_client.head_bucket(Bucket=bucket_name)
+            with self._request_slot():
+                self.dest_client.head_bucket(Bucket=bucket_name)
             return True
         except botocore.exceptions.ClientError:
             return False
@@ -262,96 +477,307 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
     def create_bucket(self, bucket_name: str) -> bool:
         """Create bucket on destination if missing."""
         if self.bucket_exists(bucket_name):
-            self.logger.debug("  Bucket already exists on destination")
+            self.logger.debug(
+                "  [%s] Bucket already exists on destination", bucket_name
+            )
             return True
 
         try:
-            self.logger.debug("  Creating bucket on destination...")
-            self.dest_client.create_bucket(Bucket=bucket_name)
-            self.logger.info("  ✓ Created bucket: %s", bucket_name)
-            self.stats["buckets_created"] += 1
+            self.logger.debug("  [%s] Creating bucket on destination...", bucket_name)
+            with self._request_slot():
+                self.dest_client.create_bucket(Bucket=bucket_name)
+            self.logger.info("  [%s] ✓ Created bucket on destination", bucket_name)
+            self._record(buckets_created=1)
+            self._dest_buckets.add(bucket_name)
             return True
         except botocore.exceptions.ClientError as err:
-            self.logger.error("  ✗ Failed to create bucket: %s", err)
-            self.logger.debug("    Error details: %s", err.response)
-            self.stats["errors"] += 1
+            if err.response["Error"]["Code"] == "BucketAlreadyOwnedByYou":
+                self.logger.debug(
+                    "  [%s] Bucket already exists on destination", bucket_name
+                )
+                self._dest_buckets.add(bucket_name)
+                return True
+            self.logger.error("  [%s] ✗ Failed to create bucket: %s", bucket_name, err)
+            self.logger.debug("    [%s] Error details: %s", bucket_name, err.response)
+            self._record(errors=1)
             return False
 
-    def list_objects(self, client, bucket_name: str, label: str) -> Dict[str, int]:
-        """List all objects in bucket, returning {key: size} mapping."""
-        objects: Dict[str, int] = {}
-        try:
-            self.logger.debug("  Listing %s objects...", label)
-            paginator = client.get_paginator("list_objects_v2")
-            page_count = 0
-            obj_count = 0
-
-            for page in paginator.paginate(Bucket=bucket_name):
-                page_count += 1
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        objects[obj["Key"]] = obj["Size"]
-                        obj_count += 1
+    def _iter_pages(
+        self, client, bucket_name: str, start_after: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield list_objects_v2 pages, optionally starting after a key."""
+        paginator = client.get_paginator("list_objects_v2")
+        if start_after is None:
+            pages = iter(paginator.paginate(Bucket=bucket_name))
+        else:
+            pages = iter(paginator.paginate(Bucket=bucket_name, StartAfter=start_after))
+        while True:
+            with self._request_slot():
+                page = next(pages, None)
+            if page is None:
+                return
+            yield page
+
+    def _iter_listing(
+        self,
+        bucket_name: str,
+        pages: Iterable[dict],
+        label: str,
+        end_at: Optional[str] = None,
+        ordered: bool = True,
+    ) -> Iterator[ListingEntry]:
+        """Yield listing entries from listing pages, up to end_at.
+
+        Unless ``ordered`` is false, keys must arrive in lexicographic order or
+        ListingOrderError is raised.
+        """
+        self.logger.debug("  [%s] Listing %s objects...", bucket_name, label)
+        page_count = 0
+        obj_count = 0
+        total_size = 0
+        largest = 0
+        smallest = 0
+        previous = None
+
+        for page in pages:
+            page_count += 1
+            contents = page.get("Contents", [])
+            for obj in contents:
+                # The merge-join with the other listing relies on key order;
+                # an unsorted listing would report live objects as extraneous.
+                if ordered and previous is not None and obj["Key"] <= previous:
+                    raise ListingOrderError(
+                        f"{label} listing is not in key order: "
+                        f"{obj['Key']!r} after {previous!r}"
+                    )
+                previous = obj["Key"]
+                if end_at is not None and obj["Key"] > end_at:
+                    break
+                size = obj["Size"]
+                obj_count += 1
+                total_size += size
+                largest = max(largest, size)
+                smallest = size if obj_count == 1 else min(smallest, size)
+                yield (
+                    obj["Key"],
+                    size,
+                    obj.get("ETag", ""),
+                    tuple(obj.get("ChecksumAlgorithm", ())),
+                    obj.get("ChecksumType", ""),
+                )
+            if end_at is not None and contents and contents[-1]["Key"] > end_at:
+                break
 
+        self.logger.debug(
+            "    [%s] Found %d %s objects across %d page(s)",
+            bucket_name,
+            obj_count,
+            label,
+            page_count,
+        )
+
+        if obj_count > 0:
+            self.logger.debug(
+                "    [%s] Total size: %s", bucket_name, self._format_bytes(total_size)
+            )
             self.logger.debug(
-                "    Found %d objects across %d page(s)", obj_count, page_count
+                "    [%s] Average size: %s",
+                bucket_name,
+                self._format_bytes(total_size // obj_count),
+            )
+            self.logger.debug(
+                "    [%s] Largest: %s", bucket_name, self._format_bytes(largest)
+            )
+            self.logger.debug(
+                "    [%s] Smallest: %s", bucket_name, self._format_bytes(smallest)
             )
 
-            if obj_count > 0:
-                sizes = list(objects.values())
-                total_size = sum(sizes)
-                avg_size = total_size / len(sizes)
-                self.logger.debug("    Total size: %s", self._format_bytes(total_size))
-                self.logger.debug(
-                    "    Average size: %s", self._format_bytes(int(avg_size))
+    def _shard_bounds(self, bucket_name: str) -> List[str]:
+        """Pick keys that split a bucket listing into list_shards key ranges.
+
+        Boundaries follow the bucket's own "/" layout, descending while there
+        is a single common prefix, and fall back to a hex alphabet under the
+        deepest prefix found. Any boundaries are correct since the ranges
+        always cover the whole key space; good ones just balance the shards.
+        """
+        prefix = ""
+        for _ in range(SHARD_PROBE_DEPTH):
+            with self._request_slot():
+                response = self.source_client.list_objects_v2(
+                    Bucket=bucket_name, Prefix=prefix, Delimiter="/"
                 )
-                self.logger.debug("    Largest: %s", self._format_bytes(max(sizes)))
-                self.logger.debug("    Smallest: %s", self._format_bytes(min(sizes)))
-
-        except botocore.exceptions.ClientError as err:
-            self.logger.error("  Failed to list objects in %s: %s", bucket_name, err)
-
-        return objects
+            prefixes = [p["Prefix"] for p in response.get("CommonPrefixes", [])]
+            if len(prefixes) != 1:
+                break
+            prefix = prefixes[0]
+
+        if len(prefixes) < 2:
+            prefixes = [prefix + char for char in SHARD_ALPHABET]
+
+        step = -(-(len(prefixes) - 1) // (self.list_shards - 1))
+        return prefixes[1::step]
+
+    def _part_ranges(self, size: int) -> Iterator[Tuple[int, int]]:
+        """Split an object size into inclusive byte ranges, one per part."""
+        chunk = max(
+            self.multipart_chunksize,
+            MIN_MULTIPART_PART_SIZE,
+            -(-size // MAX_MULTIPART_PARTS),
+        )
+        return ((lo, min(lo + chunk, size) - 1) for lo in range(0, size, chunk))
 
-    def copy_object(self, bucket: str, key: str, size: int) -> bool:
-        """Transfer single object from source to destination."""
+    @staticmethod
+    def _bounded_map(
+        executor: ThreadPoolExecutor, func: Callable, items: Iterable, limit: int
+    ) -> Iterator:
+        """Like executor.map, but with at most ``limit`` calls submitted at once.
+
+        If a result raises, calls that have not started yet are cancelled and
+        the ones already running are waited for before the error propagates.
+        """
+        pending: Deque[Future] = collections.deque()
         try:
-            response = self.source_client.get_object(Bucket=bucket, Key=key)
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= limit:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+    def _copy_part(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        bucket: str,
+        key: str,
+        etag: str,
+        upload_id: str,
+        part_number: int,
+        byte_range: Tuple[int, int],
+    ) -> dict:
+        """Copy one byte range into a multipart upload and return its part.
+
+        The read is conditional on ``etag``, so a source object replaced
+        mid-copy fails with PreconditionFailed instead of mixing versions.
+        """
+        conditions = {"IfMatch": etag} if etag else {}
+        with self._request_slot():
+            response = self.source_client.get_object(
+                Bucket=bucket,
+                Key=key,
+                Range=f"bytes={byte_range[0]}-{byte_range[1]}",
+                **conditions,
+            )
             body = response["Body"]
-
-            transfer_config = TransferConfig(
-                multipart_threshold=self.multipart_threshold,
-                multipart_chunksize=self.multipart_chunksize,
-                max_concurrency=self.max_concurrency,
-                use_threads=True,
-                max_io_queue=1000,
+            data = body.read()
+            body.close()
+        with self._request_slot():
+            response = self.dest_client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data,
             )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
 
-            self.dest_client.upload_fileobj(body, bucket, key, Config=transfer_config)
-            body.close()
+    def _copy_multipart(self, bucket: str, key: str, size: int, etag: str) -> None:
+        """Copy a large object as parallel parts, aborting the upload on failure."""
+        with self._request_slot():
+            response = self.dest_client.create_multipart_upload(Bucket=bucket, Key=key)
+        upload_id = response["UploadId"]
+        try:
+            parts = list(
+                self._bounded_map(
+                    self._part_executor,
+                    lambda part: self._copy_part(
+                        bucket, key, etag, upload_id, part[0], part[1]
+                    ),
+                    enumerate(self._part_ranges(size), 1),
+                    self.max_concurrency,
+                )
+            )
 
-            self.stats["bytes_transferred"] += size
+            with self._request_slot():
+                self.dest_client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except Exception:
+            try:
+                with self._request_slot():
+                    self.dest_client.abort_multipart_upload(
+                        Bucket=bucket, Key=key, UploadId=upload_id
+                    )
+            except botocore.exceptions.ClientError as err:
+                self.logger.debug(
+                    "    [%s] Failed to abort upload for %s: %s", bucket, key, err
+                )
+            raise
 
-            size_str = self._format_bytes(size)
+    def copy_object(self, bucket: str, key: str, size: int, etag: str) -> bool:
+        """Transfer single object from source to destination."""
+        try:
             if size >= self.multipart_threshold:
-                self.logger.debug("    ✓ %s [%s] (multipart)", key, size_str)
+                self._copy_multipart(bucket, key, size, etag)
+                mode = "multipart"
             else:
-                self.logger.debug("    ✓ %s [%s]", key, size_str)
+                with self._request_slot():
+                    response = self.source_client.get_object(Bucket=bucket, Key=key)
+                    body = response["Body"]
+                    data = body.read()
+                    body.close()
+
+                with self._request_slot():
+                    self.dest_client.put_object(
+                        Bucket=bucket, Key=key, Body=data, ContentLength=len(data)
+                    )
+                mode = ""
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                size_str = self._format_bytes(size)
+                if mode:
+                    self.logger.debug(
+                        "    [%s] ✓ %s [%s] (%s)", bucket, key, size_str, mode
+                    )
+                else:
+                    self.logger.debug("    [%s] ✓ %s [%s]", bucket, key, size_str)
 
             return True
         except Exception as err:  # pylint: disable=broad-except
-            self.logger.error("    ✗ Failed to copy %s: %s", key, err)
+            self.logger.error("    [%s] ✗ Failed to copy %s: %s", bucket, key, err)
             return False
 
-    def delete_object(self, bucket: str, key: str) -> bool:
-        """Remove object from destination."""
+    def delete_objects(self, bucket: str, keys: List[str]) -> Tuple[int, int]:
+        """Remove a batch of objects from destination, returning (ok, failed)."""
         try:
-            self.dest_client.delete_object(Bucket=bucket, Key=key)
-            self.logger.debug("    ✓ Deleted: %s", key)
-            return True
+            with self._request_slot():
+                response = self.dest_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                )
         except botocore.exceptions.ClientError as err:
-            self.logger.error("    ✗ Failed to delete %s: %s", key, err)
-            return False
+            self.logger.error(
+                "    [%s] ✗ Failed to delete %d objects: %s", bucket, len(keys), err
+            )
+            return 0, len(keys)
+
+        errors = response.get("Errors", [])
+        for error in errors:
+            self.logger.error(
+                "    [%s] ✗ Failed to delete %s: %s",
+                bucket,
+                error["Key"],
+                error.get("Message"),
+            )
+        self.logger.debug(
+            "    [%s] ✓ Deleted batch of %d", bucket, len(keys) - len(errors)
+        )
+        return len(keys) - len(errors), len(errors)
 
     @staticmethod
     def _format_bytes(num_bytes: int) -> str:
@@ -374,97 +800,395 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
         minutes = int((seconds % 3600) // 60)
         return f"{hours}h {minutes}m"
 
-    def _calculate_differences(
+    def _object_checksum(
+        self, client, bucket_name: str, key: str, algorithm: str
+    ) -> Optional[str]:
+        """Fetch a full-object checksum, or None if it is unavailable."""
+        try:
+            with self._request_slot():
+                response = client.get_object_attributes(
+                    Bucket=bucket_name, Key=key, ObjectAttributes=["Checksum"]
+                )
+        except botocore.exceptions.ClientError as err:
+            self.logger.debug(
+                "    [%s] Checksum unavailable for %s: %s", bucket_name, key, err
+            )
+            return None
+
+        checksum = response.get("Checksum", {})
+        value = checksum.get(f"Checksum{algorithm}")
+        if not value or "-" in value:
+            return None
+        if checksum.get("ChecksumType", "FULL_OBJECT") != "FULL_OBJECT":
+            return None
+        return value
+
+    def _checksums_differ(
+        self, bucket_name: str, src: ListingEntry, dest: ListingEntry
+    ) -> bool:
+        """Compare checksums of same-size objects whose ETags are inconclusive."""
+        # Composite checksums are built from the parts, so like multipart
+        # ETags they depend on the upload's part layout. The listing already
+        # says which kind each object has, so only full-object ones are fetched.
+        algorithms = set(src[3]) & set(dest[3])
+        if (
+            not self.compare_checksums
+            or not algorithms
+            or src[4] != "FULL_OBJECT"
+            or dest[4] != "FULL_OBJECT"
+        ):
+            return False
+
+        algorithm = min(algorithms)
+        src_checksum = self._object_checksum(
+            self.source_client, bucket_name, src[0], algorithm
+        )
+        dest_checksum = self._object_checksum(
+            self.dest_client, bucket_name, dest[0], algorithm
+        )
+        if src_checksum is None or dest_checksum is None:
+            return False
+        if src_checksum == dest_checksum:
+            self.logger.debug(
+                "    [%s] Unchanged by %s checksum: %s", bucket_name, algorithm, src[0]
+            )
+            return False
+        return True
+
+    def _object_changed(
+        self, bucket_name: str, src: ListingEntry, dest: ListingEntry
+    ) -> bool:
+        """Decide whether a key present on both sides needs copying."""
+        if src[1] != dest[1]:
+            return True
+        if src[2] and src[2] == dest[2]:
+            return False
+        # Multipart ETags hash the part layout as well as the content, and the
+        # mirror re-uploads with its own part size, so they cannot be compared.
+        if self.compare_etags and src[2] and dest[2] and "-" not in src[2] + dest[2]:
+            return True
+        return self._checksums_differ(bucket_name, src, dest)
+
+    def _iter_differences(  # pylint: disable=too-many-locals
+        self,
+        bucket_name: str,
+        to_delete: List[str],
+        totals: List[Tuple[int, int, int, int]],
+        key_range: Tuple[Optional[str], Optional[str]] = (None, None),
+        source_pages: Optional[Iterable[dict]] = None,
+    ) -> Iterator[CopyItem]:
+        """Merge-join both listings, yielding the objects to copy.
+
+        ListObjectsV2 returns keys in lexicographic order, so walking the source
+        and destination listings side by side finds new, changed and
+        destination-only keys without holding either bucket in memory. Only
+        keys in the (start_after, end_at] ``key_range`` are compared.
+        Destination-only keys are appended to ``to_delete``, and the shard's
+        (source, destination, copy, copy bytes) counts to ``totals``.
+        """
+        start_after, end_at = key_range
+        if source_pages is None:
+            source_pages = self._iter_pages(
+                self.source_client, bucket_name, start_after
+            )
+        src_iter = self._iter_listing(bucket_name, source_pages, "source", end_at)
+        dest_iter = self._iter_listing(
+            bucket_name,
+            self._iter_pages(self.dest_client, bucket_name, start_after),
+            "destination",
+            end_at,
+        )
+        src = next(src_iter, None)
+        dest = next(dest_iter, None)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        src_count = 0
+        dest_count = 0
+        copy_count = 0
+        total_copy_bytes = 0
+
+        while src is not None or dest is not None:
+            if dest is None or (src is not None and src[0] < dest[0]):
+                src_count += 1
+                copy_count += 1
+                total_copy_bytes += src[1]
+                if debug:
+                    self.logger.debug(
+                        "    [%s] New file: %s (%s)",
+                        bucket_name,
+                        src[0],
+                        self._format_bytes(src[1]),
+                    )
+                yield src[:3]
+                src = next(src_iter, None)
+            elif src is None or dest[0] < src[0]:
+                dest_count += 1
+                if self.delete_extraneous:
+                    to_delete.append(dest[0])
+                dest = next(dest_iter, None)
+            else:
+                src_count += 1
+                dest_count += 1
+                if self._object_changed(bucket_name, src, dest):
+                    copy_count += 1
+                    total_copy_bytes += src[1]
+                    if debug:
+                        self.logger.debug(
+                            "    [%s] Changed: %s (src:%s %s != dst:%s %s)",
+                            bucket_name,
+                            src[0],
+                            self._format_bytes(src[1]),
+                            src[2],
+                            self._format_bytes(dest[1]),
+                            dest[2],
+                        )
+                    yield src[:3]
+                src = next(src_iter, None)
+                dest = next(dest_iter, None)
+
+        totals.append((src_count, dest_count, copy_count, total_copy_bytes))
+
+    def _iter_unordered_differences(
         self,
-        src_objects: Dict[str, int],
-        dest_objects: Dict[str, int],
-    ) -> Tuple[List[Tuple[str, int]], Set[str], int]:
-        """Determine what to copy and delete, and total bytes to copy."""
-        to_copy: List[Tuple[str, int]] = []
-        to_delete: Set[str] = set()
+        bucket_name: str,
+        to_delete: List[str],
+        totals: List[Tuple[int, int, int, int]],
+    ) -> Iterator[CopyItem]:
+        """Compare full listings held in memory, yielding the objects to copy.
+
+        Used for endpoints that do not list keys in order. Both listings are
+        read completely before any key is compared or queued for deletion.
+        """
+        src_objects = {
+            entry[0]: entry
+            for entry in self._iter_listing(
+                bucket_name,
+                self._iter_pages(self.source_client, bucket_name),
+                "source",
+                ordered=False,
+            )
+        }
+        dest_objects = {
+            entry[0]: entry
+            for entry in self._iter_listing(
+                bucket_name,
+                self._iter_pages(self.dest_client, bucket_name),
+                "destination",
+                ordered=False,
+            )
+        }
+
+        copy_count = 0
         total_copy_bytes = 0
+        for key, src in src_objects.items():
+            dest = dest_objects.get(key)
+            if dest is None or self._object_changed(bucket_name, src, dest):
+                copy_count += 1
+                total_copy_bytes += src[1]
+                yield src[:3]
+
+        if self.delete_extraneous:
+            to_delete.extend(dest_objects.keys() - src_objects.keys())
+        totals.append(
+            (len(src_objects), len(dest_objects), copy_count, total_copy_bytes)
+        )
 
-        for key, size in src_objects.items():
-            if key not in dest_objects:
-                to_copy.append((key, size))
-                total_copy_bytes += size
+    def _iter_parallel(self, iterators: List[Iterator]) -> Iterator:
+        """Drain iterators on separate threads, yielding items as they arrive."""
+        items: queue.Queue = queue.Queue(maxsize=self.max_workers * 2)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def drain(iterator: Iterator) -> None:
+            try:
+                for item in iterator:
+                    if not put(item):
+                        return
+            except Exception as err:  # pylint: disable=broad-except
+                put(err)
+                return
+            put(done)
+
+        with ThreadPoolExecutor(max_workers=len(iterators)) as executor:
+            for iterator in iterators:
+                executor.submit(drain, iterator)
+            try:
+                remaining = len(iterators)
+                while remaining:
+                    item = items.get()
+                    if item is done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
+
+    def _iter_bucket_differences(
+        self, bucket_name: str, to_delete: List[str]
+    ) -> Iterator[CopyItem]:
+        """Yield objects to copy, listing large buckets as parallel key ranges.
+
+        A single probe page decides whether sharding is worthwhile: buckets
+        whose source listing fits in one page reuse it and are compared
+        directly, as are larger buckets when list_shards is 1, continuing
+        after the probe page. Buckets whose listings turn out not to be in
+        key order are compared again from full listings.
+        """
+        totals: List[Tuple[int, int, int, int]] = []
+        with self._request_slot():
+            probe = self.source_client.list_objects_v2(Bucket=bucket_name)
+
+        try:
+            if self.list_shards > 1 and probe.get("IsTruncated"):
+                bounds = self._shard_bounds(bucket_name)
                 self.logger.debug(
-                    "    New file: %s (%s)", key, self._format_bytes(size)
+                    "  [%s] Listing in %d key ranges: %s",
+                    bucket_name,
+                    len(bounds) + 1,
+                    bounds,
+                )
+                key_ranges = list(zip([None] + bounds, bounds + [None]))
+                yield from self._iter_parallel(
+                    [
+                        self._iter_differences(bucket_name, to_delete, totals, key_range)
+                        for key_range in key_ranges
+                    ]
+                )
+            else:
+                source_pages: Iterable[dict] = [probe]
+                if probe.get("IsTruncated"):
+                    # Serial listing: carry on from the probe page's last key.
+                    source_pages = itertools.chain(
+                        source_pages,
+                        self._iter_pages(
+                            self.source_client, bucket_name, probe["Contents"][-1]["Key"]
+                        ),
+                    )
+                yield from self._iter_differences(
+                    bucket_name, to_delete, totals, source_pages=source_pages
                 )
-            elif dest_objects[key] != size:
-                to_copy.append((key, size))
-                total_copy_bytes += size
+        except ListingOrderError as err:
+            self.logger.warning(
+                "  [%s] %s; comparing full listings instead", bucket_name, err
+            )
+            to_delete.clear()
+            totals.clear()
+            yield from self._iter_unordered_differences(bucket_name, to_delete, totals)
+
+        src_count, dest_count, copy_count, total_copy_bytes = (
+            sum(column) for column in zip(*totals)
+        )
+        self.logger.info("  [%s] Source: %d objects", bucket_name, src_count)
+        self.logger.info("  [%s] Destination: %d objects", bucket_name, dest_count)
+
+        if to_delete and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("  [%s] Files to delete: %d", bucket_name, len(to_delete))
+            for k in itertools.islice(to_delete, 5):
+                self.logger.debug("    [%s] - %s", bucket_name, k)
+            if len(to_delete) > 5:
                 self.logger.debug(
-                    "    Changed: %s (src:%s != dst:%s)",
-                    key,
-                    self._format_bytes(size),
-                    self._format_bytes(dest_objects[key]),
+                    "    [%s] ... and %d more", bucket_name, len(to_delete) - 5
                 )
 
-        if self.delete_extraneous:
-            extra = set(dest_objects.keys()) - set(src_objects.keys())
-            if extra:
-                to_delete = extra
-                self.logger.debug("  Files to delete: %d", len(to_delete))
-                for k in list(to_delete)[:5]:
-                    self.logger.debug("    - %s", k)
-                if len(to_delete) > 5:
-                    self.logger.debug("    ... and %d more", len(to_delete) - 5)
-
-        return to_copy, to_delete, total_copy_bytes
-
-    def _run_parallel_copy(
-        self,
-        bucket_name: str,
-        to_copy: List[Tuple[str, int]],
-        total_copy_bytes: int,
+        if copy_count or to_delete:
+            self.logger.info(
+                "  [%s] Actions: %d to copy (%s), %d to delete",
+                bucket_name,
+                copy_count,
+                self._format_bytes(total_copy_bytes),
+                len(to_delete),
+            )
+
+    def _copy_worker(
+        self, bucket_name: str, copy_queue: queue.Queue, progress: Iterator[int]
+    ) -> Counter:
+        """Copy queued objects until a None sentinel, returning stat deltas.
+
+        Counts stay local to the worker and are merged once it finishes, so
+        the per-object path never touches the shared statistics.
+        """
+        counts: Counter = collections.Counter()
+        while True:
+            item = copy_queue.get()
+            if item is None:
+                return counts
+
+            if self.copy_object(bucket_name, *item):
+                counts["objects_copied"] += 1
+                counts["bytes_transferred"] += item[1]
+            else:
+                counts["errors"] += 1
+
+            completed = next(progress)
+            if completed % 50 == 0:
+                self.logger.debug(
+                    "  [%s] Progress: %d copies done", bucket_name, completed
+                )
+
+    def _run_parallel_copy(  # pylint: disable=too-many-locals
+        self, bucket_name: str, to_copy: Iterable[CopyItem]
     ) -> Tuple[int, int]:
-        """Execute parallel object copies and return (success, failed)."""
-        if not to_copy:
-            return 0, 0
+        """Execute parallel object copies and return (success, failed).
 
-        self.logger.debug("  Starting parallel copy (%d workers)...", self.max_workers)
+        Objects are handed to the workers through a bounded queue as
+        ``to_copy`` produces them, so copying overlaps with listing.
+        """
+        self.logger.debug(
+            "  [%s] Starting parallel copy (%d workers)...",
+            bucket_name,
+            self.max_workers,
+        )
         copy_start = time.time()
-        success = 0
-        failed = 0
+        copy_queue: queue.Queue = queue.Queue(maxsize=self.max_workers * 2)
+        progress = itertools.count(1)
+        total_copy_bytes = 0
+        counts: Counter = collections.Counter()
 
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.copy_object, bucket_name, key, size): (key, size)
-                for key, size in to_copy
-            }
-
-            completed = 0
-            for future in as_completed(futures):
-                completed += 1
-                if future.result():
-                    success += 1
-                    self.stats["objects_copied"] += 1
-                else:
-                    failed += 1
-                    self.stats["errors"] += 1
-
-                if completed % 50 == 0:
-                    progress_pct = (completed / len(to_copy)) * 100
-                    self.logger.debug(
-                        "  Progress: %d/%d (%.0f%%) - %d ok, %d failed",
-                        completed,
-                        len(to_copy),
-                        progress_pct,
-                        success,
-                        failed,
-                    )
+            workers = [
+                executor.submit(self._copy_worker, bucket_name, copy_queue, progress)
+                for _ in range(self.max_workers)
+            ]
+            try:
+                for item in to_copy:
+                    copy_queue.put(item)
+                    total_copy_bytes += item[1]
+            finally:
+                for _ in workers:
+                    copy_queue.put(None)
+                for worker in workers:
+                    counts.update(worker.result())
+                self._record(**counts)
+
+        success = counts["objects_copied"]
+        failed = counts["errors"]
+
+        if success + failed == 0:
+            return 0, 0
 
         copy_duration = time.time() - copy_start
         throughput = total_copy_bytes / copy_duration if copy_duration > 0 else 0.0
         self.logger.info(
-            "  ✓ Copied %d objects in %.1fs (%s/s)",
+            "  [%s] ✓ Copied %d objects in %.1fs (%s/s)",
+            bucket_name,
             success,
             copy_duration,
             self._format_bytes(int(throughput)),
         )
         if failed > 0:
-            self.logger.warning("  ⚠ %d objects failed to copy", failed)
+            self.logger.warning(
+                "  [%s] ⚠ %d objects failed to copy", bucket_name, failed
+            )
 
         return success, failed
 
@@ -479,79 +1203,89 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
 
         bucket_start = time.time()
 
-        self.logger.debug("  Checking if bucket exists on destination...")
+        self.logger.debug(
+            "  [%s] Checking if bucket exists on destination...", bucket_name
+        )
         if not self.create_bucket(bucket_name):
-            self.logger.warning("  Skipping bucket due to creation failure")
-            self.stats["buckets_skipped"] += 1
+            self.logger.warning(
+                "  [%s] Skipping bucket due to creation failure", bucket_name
+            )
+            self._record(buckets_skipped=1)
             return
 
-        src_objects = self.list_objects(self.source_client, bucket_name, "source")
-        dest_objects = self.list_objects(self.dest_client, bucket_name, "destination")
-
-        self.logger.info("  Source: %d objects", len(src_objects))
-        self.logger.info("  Destination: %d objects", len(dest_objects))
-
-        # Calculate differences
-        self.logger.debug("  Calculating differences...")
-        to_copy, to_delete, total_copy_bytes = self._calculate_differences(
-            src_objects, dest_objects
-        )
+        to_delete: List[str] = []
+        try:
+            success_copies, failed_copies = self._run_parallel_copy(
+                bucket_name, self._iter_bucket_differences(bucket_name, to_delete)
+            )
+        except botocore.exceptions.ClientError as err:
+            self.logger.error("  [%s] Failed to list objects: %s", bucket_name, err)
+            self.logger.warning(
+                "  [%s] Skipping remaining work due to listing failure", bucket_name
+            )
+            self._record(errors=1, buckets_skipped=1)
+            return
 
-        if not to_copy and not to_delete:
-            self.logger.info("  ✓ Already synchronized (no changes needed)")
-            self.stats["buckets_processed"] += 1
+        if not success_copies and not failed_copies and not to_delete:
+            self.logger.info(
+                "  [%s] ✓ Already synchronized (no changes needed)", bucket_name
+            )
+            self._record(buckets_processed=1)
             bucket_duration = time.time() - bucket_start
-            self.logger.debug("  Bucket processing time: %.1fs", bucket_duration)
+            self.logger.debug(
+                "  [%s] Bucket processing time: %.1fs", bucket_name, bucket_duration
+            )
             return
 
-        self.logger.info(
-            "  Actions: %d to copy (%s), %d to delete",
-            len(to_copy),
-            self._format_bytes(total_copy_bytes),
-            len(to_delete),
-        )
-
-        success_copies, _failed_copies = self._run_parallel_copy(
-            bucket_name, to_copy, total_copy_bytes
-        )
-
+        success_del = 0
+        failed_del = 0
         if to_delete:
             self.logger.debug(
-                "  Starting parallel delete (%d workers)...", self.max_workers
+                "  [%s] Starting parallel delete (%d workers)...",
+                bucket_name,
+                self.max_workers,
             )
             delete_start = time.time()
-            success_del = 0
-            failed_del = 0
 
+            batches = (
+                to_delete[i : i + DELETE_BATCH_SIZE]
+                for i in range(0, len(to_delete), DELETE_BATCH_SIZE)
+            )
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self.delete_object, bucket_name, key): key
-                    for key in to_delete
-                }
-                for future in as_completed(futures):
-                    if future.result():
-                        success_del += 1
-                        self.stats["objects_deleted"] += 1
-                    else:
-                        failed_del += 1
-                        self.stats["errors"] += 1
+                for deleted, failed in self._bounded_map(
+                    executor,
+                    lambda batch: self.delete_objects(bucket_name, batch),
+                    batches,
+                    2 * self.max_workers,
+                ):
+                    success_del += deleted
+                    failed_del += failed
+                    self._record(objects_deleted=deleted, errors=failed)
 
             delete_duration = time.time() - delete_start
             self.logger.info(
-                "  ✓ Deleted %d objects in %.1fs", success_del, delete_duration
+                "  [%s] ✓ Deleted %d objects in %.1fs",
+                bucket_name,
+                success_del,
+                delete_duration,
             )
             if failed_del > 0:
-                self.logger.warning("  ⚠ %d objects failed to delete", failed_del)
+                self.logger.warning(
+                    "  [%s] ⚠ %d objects failed to delete", bucket_name, failed_del
+                )
 
         bucket_duration = time.time() - bucket_start
-        self.logger.info("  ✓ Bucket completed in %.1fs", bucket_duration)
+        self.logger.info(
+            "  [%s] ✓ Bucket completed in %.1fs", bucket_name, bucket_duration
+        )
         self.logger.debug(
-            "  Bucket stats: copied=%d, deleted=%d, errors=%d",
+            "  [%s] Bucket stats: copied=%d, deleted=%d, errors=%d",
+            bucket_name,
             success_copies,
-            self.stats["objects_deleted"],
-            self.stats["errors"],
+            success_del,
+            failed_copies + failed_del,
         )
-        self.stats["buckets_processed"] += 1
+        self._record(buckets_processed=1)
 
     def mirror_all_buckets(self) -> None:
         """Execute full mirror operation across all buckets."""
@@ -568,13 +1302,24 @@ class S3Mirror:  # pylint: disable=too-many-instance-attributes
         self.logger.info("")
         self.logger.info("Starting synchronization of %d bucket(s)", len(buckets))
         self.logger.info(
-            "Performance: %d workers, %s multipart threshold",
+            "Performance: %d workers x %d buckets, %s multipart threshold",
             self.max_workers,
+            self.bucket_workers,
             self._format_bytes(self.multipart_threshold),
         )
 
-        for idx, bucket in enumerate(buckets, 1):
-            self.sync_bucket(bucket, idx, len(buckets))
+        # Each bucket keeps its own object worker pool, so up to
+        # bucket_workers * max_workers copies can be in flight at once.
+        with ThreadPoolExecutor(max_workers=self.bucket_workers) as executor:
+            list(
+                executor.map(
+                    lambda args: self.sync_bucket(*args),
+                    [
+                        (bucket, idx, len(buckets))
+                        for idx, bucket in enumerate(buckets, 1)
+                    ],
+                )
+            )
 
     def print_summary(self) -> None:
         """Generate and log final summary report."""
@@ -669,13 +1414,16 @@ def setup_logging(args: argparse.Namespace) -> logging.Logger:
         logger.info("# NEW SESSION: %s", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
         logger.info("#" * 70)
 
+    # Let debug calls on the hot path bail out early when no handler wants them.
+    logger.setLevel(min(handler.level for handler in logger.handlers))
+
     return logger
 
 
 def load_config(config_path: Optional[str]) -> dict:
     """Load configuration from file or use defaults."""
     if not config_path:
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
 
     config_file = Path(config_path)
 
@@ -688,7 +1436,7 @@ def load_config(config_path: Optional[str]) -> dict:
             if config_path.endswith(".json"):
                 user_config = json.load(file)
             elif config_path.endswith(".yaml") or config_path.endswith(".yml"):
-                user_config = yaml.safe_load(file)
+                user_config = yaml.load(file, Loader=SafeLoader)
             else:
                 print(
                     "Error: Unsupported config format. Use .json or .yaml",
@@ -696,7 +1444,7 @@ def load_config(config_path: Optional[str]) -> dict:
                 )
                 sys.exit(1)
 
-        config = DEFAULT_CONFIG.copy()
+        config = copy.deepcopy(DEFAULT_CONFIG)
         for key in user_config:
             if isinstance(user_config[key], dict):
                 config[key].update(user_config[key])
@@ -797,7 +1545,7 @@ def main():
         config["sync"]["delete_extraneous"] = False
 
     if args.show_config:
-        display_config = json.loads(json.dumps(config))
+        display_config = copy.deepcopy(config)
         display_config["source"]["aws_secret_access_key"] = "***REDACTED***"
         display_config["destination"]["aws_secret_access_key"] = "***REDACTED***"
         print(json.dumps(display_config, indent=2))
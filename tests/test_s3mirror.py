@@ -0,0 +1,390 @@
+"""Tests for the bucket listing merge-join and multipart copies."""
+
+import contextlib
+import copy
+import io
+import logging
+import threading
+import time
+import unittest
+from unittest import mock
+
+import s3mirror
+
+
+class StubClient:
+    """Listing-only stand-in for a boto3 S3 client over an in-memory bucket."""
+
+    page_size = 1000
+
+    def __init__(self, objects: dict):
+        self.objects = objects
+
+    def list_objects_v2(self, **kwargs) -> dict:
+        """Return one page of keys in lexicographic order."""
+        prefix = kwargs.get("Prefix", "")
+        delimiter = kwargs.get("Delimiter")
+        after = kwargs.get("ContinuationToken") or kwargs.get("StartAfter", "")
+        keys = sorted(
+            key for key in self.objects if key.startswith(prefix) and key > after
+        )
+        if delimiter:
+            prefixes = sorted(
+                {
+                    prefix + key[len(prefix) :].split(delimiter)[0] + delimiter
+                    for key in keys
+                    if delimiter in key[len(prefix) :]
+                }
+            )
+            return {"CommonPrefixes": [{"Prefix": p} for p in prefixes]}
+
+        page = keys[: self.page_size]
+        response = {
+            "IsTruncated": len(keys) > len(page),
+            "Contents": [
+                {"Key": key, "Size": self.objects[key][0], "ETag": self.objects[key][1]}
+                for key in page
+            ],
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+    def get_paginator(self, _name):
+        """Return a paginator that follows continuation tokens."""
+        return self
+
+    def paginate(self, **kwargs):
+        """Yield every page of a listing."""
+        while True:
+            page = self.list_objects_v2(**kwargs)
+            yield page
+            if not page["IsTruncated"]:
+                return
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+
+class UnsortedClient(StubClient):
+    """Stub client returning each listing page in reverse key order."""
+
+    def list_objects_v2(self, **kwargs) -> dict:
+        """Return one page of keys in reverse order."""
+        response = super().list_objects_v2(**kwargs)
+        response.get("Contents", []).reverse()
+        return response
+
+
+class DeletingClient(StubClient):
+    """Stub client that records DeleteObjects batches."""
+
+    def __init__(self, objects: dict):
+        super().__init__(objects)
+        self.deleted = []
+
+    def delete_objects(self, **kwargs) -> dict:
+        """Record the deleted keys."""
+        self.deleted.extend(obj["Key"] for obj in kwargs["Delete"]["Objects"])
+        return {}
+
+
+def make_objects(count: int) -> dict:
+    """Build count keys mapped to (size, ETag)."""
+    return {f"dir{i % 7}/key{i:05d}": (i, f'"etag{i}"') for i in range(count)}
+
+
+class BucketDifferencesTest(unittest.TestCase):
+    """Merge-join of source and destination listings."""
+
+    def make_mirror(self, source: dict, dest: dict, list_shards: int):
+        """Create a mirror whose clients list the given objects."""
+        config = copy.deepcopy(s3mirror.DEFAULT_CONFIG)
+        config["performance"]["list_shards"] = list_shards
+        mirror = s3mirror.S3Mirror(config, logging.getLogger("test"))
+        mirror.source_client = StubClient(source)
+        mirror.dest_client = StubClient(dest)
+        return mirror
+
+    def differences(self, source: dict, dest: dict, list_shards: int):
+        """Return sorted (to_copy, to_delete) keys for one bucket."""
+        mirror = self.make_mirror(source, dest, list_shards)
+        to_delete = []
+        # pylint: disable-next=protected-access
+        differences = mirror._iter_bucket_differences("bucket", to_delete)
+        to_copy = [key for key, *_ in differences]
+        return sorted(to_copy), sorted(to_delete)
+
+    def test_identical_buckets(self):
+        """Multi-page identical buckets need no copies or deletes."""
+        objects = make_objects(2500)
+        for list_shards in (1, 2, 16):
+            with self.subTest(list_shards=list_shards):
+                self.assertEqual(
+                    self.differences(objects, dict(objects), list_shards), ([], [])
+                )
+
+    def test_new_changed_and_extraneous_keys(self):
+        """New, changed and destination-only keys are found past the first page."""
+        source = make_objects(2500)
+        dest = dict(source)
+        del dest["dir0/key02401"]
+        dest["dir1/key01779"] = (0, '"other"')
+        dest["dir3/key02480b"] = (1, '"extra"')
+
+        for list_shards in (1, 16):
+            with self.subTest(list_shards=list_shards):
+                self.assertEqual(
+                    self.differences(source, dest, list_shards),
+                    (["dir0/key02401", "dir1/key01779"], ["dir3/key02480b"]),
+                )
+
+    def test_single_page_bucket(self):
+        """Buckets that fit in the probe page are compared from it."""
+        source = make_objects(10)
+        dest = make_objects(5)
+        self.assertEqual(
+            self.differences(source, dest, 16),
+            (sorted(set(source) - set(dest)), []),
+        )
+
+    def test_unsorted_listing_falls_back_to_full_listings(self):
+        """Out-of-order listings are compared from full listings instead."""
+        source = make_objects(2500)
+        dest = dict(source)
+        del dest["dir0/key02401"]
+        dest["dir1/key01779"] = (0, '"other"')
+        dest["dir3/key02480b"] = (1, '"extra"')
+
+        for list_shards in (1, 16):
+            with self.subTest(list_shards=list_shards):
+                mirror = self.make_mirror({}, dest, list_shards)
+                mirror.source_client = UnsortedClient(source)
+                to_delete = []
+                # pylint: disable-next=protected-access
+                differences = mirror._iter_bucket_differences("bucket", to_delete)
+                to_copy = sorted(key for key, *_ in differences)
+                self.assertEqual(to_copy, ["dir0/key02401", "dir1/key01779"])
+                self.assertEqual(to_delete, ["dir3/key02480b"])
+
+    def test_unsorted_listing_deletes_nothing_live(self):
+        """A bucket listed out of order syncs without deleting live objects."""
+        objects = {key: (1, '"etag"') for key in "abcd"}
+        mirror = self.make_mirror({}, {}, 1)
+        mirror.source_client = UnsortedClient(objects)
+        mirror.dest_client = DeletingClient(dict(objects))
+        mirror._dest_buckets = {"bucket"}  # pylint: disable=protected-access
+
+        mirror.sync_bucket("bucket", 1, 1)
+        self.assertEqual(mirror.dest_client.deleted, [])
+        self.assertEqual(mirror.stats["errors"], 0)
+        self.assertEqual(mirror.stats["buckets_processed"], 1)
+
+    def test_rejects_non_positive_list_shards(self):
+        """list_shards below one is rejected at construction."""
+        with self.assertRaises(ValueError):
+            self.make_mirror({}, {}, 0)
+
+
+class AttributesClient:  # pylint: disable=too-few-public-methods
+    """Client answering GetObjectAttributes with a fixed checksum."""
+
+    def __init__(self, checksum: str):
+        self.checksum = checksum
+        self.calls = 0
+
+    def get_object_attributes(self, **_kwargs) -> dict:
+        """Return a full-object CRC32 checksum."""
+        self.calls += 1
+        return {
+            "Checksum": {"ChecksumCRC32": self.checksum, "ChecksumType": "FULL_OBJECT"}
+        }
+
+
+class ChecksumComparisonTest(unittest.TestCase):
+    """Checksum fallback for same-size objects with inconclusive ETags."""
+
+    def changed(self, src_type: str, dest_type: str, checksums=("a", "b")):
+        """Compare two multipart-ETag entries; return (changed, lookups)."""
+        mirror = s3mirror.S3Mirror(
+            copy.deepcopy(s3mirror.DEFAULT_CONFIG), logging.getLogger("test")
+        )
+        mirror.source_client = AttributesClient(checksums[0])
+        mirror.dest_client = AttributesClient(checksums[1])
+        src = ("key", 10, '"a-2"', ("CRC32",), src_type)
+        dest = ("key", 10, '"b-3"', ("CRC32",), dest_type)
+        # pylint: disable-next=protected-access
+        changed = mirror._object_changed("bucket", src, dest)
+        lookups = mirror.source_client.calls + mirror.dest_client.calls
+        return changed, lookups
+
+    def test_full_object_checksums_are_compared(self):
+        """Full-object checksums on both sides decide the comparison."""
+        self.assertEqual(self.changed("FULL_OBJECT", "FULL_OBJECT"), (True, 2))
+        self.assertEqual(
+            self.changed("FULL_OBJECT", "FULL_OBJECT", ("a", "a")), (False, 2)
+        )
+
+    def test_composite_checksums_are_not_fetched(self):
+        """Composite or unlisted checksum types skip GetObjectAttributes."""
+        for types in (
+            ("COMPOSITE", "COMPOSITE"),
+            ("FULL_OBJECT", "COMPOSITE"),
+            ("", ""),
+        ):
+            with self.subTest(types=types):
+                self.assertEqual(self.changed(*types), (False, 0))
+
+
+class RangedSource:  # pylint: disable=too-few-public-methods
+    """Source client serving ranged reads of one object, honouring IfMatch."""
+
+    def __init__(self, data: bytes, etag: str):
+        self.data = data
+        self.etag = etag
+        self.reads = []
+
+    def get_object(self, **kwargs) -> dict:
+        """Return a byte range, or fail like S3 if the ETag no longer matches."""
+        self.reads.append(kwargs)
+        if kwargs.get("IfMatch") != self.etag:
+            raise s3mirror.botocore.exceptions.ClientError(
+                {"Error": {"Code": "PreconditionFailed"}}, "GetObject"
+            )
+        low, high = kwargs["Range"][len("bytes=") :].split("-")
+        return {"Body": io.BytesIO(self.data[int(low) : int(high) + 1])}
+
+
+class MultipartDest:
+    """Destination client recording a single multipart upload."""
+
+    def __init__(self, delay: float = 0.0):
+        self.parts = {}
+        self.completed = False
+        self.aborted = False
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def create_multipart_upload(self, **_kwargs) -> dict:
+        """Start the upload."""
+        return {"UploadId": "upload"}
+
+    def upload_part(self, **kwargs) -> dict:
+        """Store one part, tracking how many uploads run at once."""
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        self.parts[kwargs["PartNumber"]] = kwargs["Body"]
+        return {"ETag": f'"part{kwargs["PartNumber"]}"'}
+
+    def complete_multipart_upload(self, **_kwargs) -> None:
+        """Finish the upload."""
+        self.completed = True
+
+    def abort_multipart_upload(self, **_kwargs) -> None:
+        """Abandon the upload."""
+        self.aborted = True
+
+
+def make_multipart_mirror(test: unittest.TestCase, source, dest):
+    """Create a mirror that copies in 1 KiB parts for the duration of test."""
+    patcher = mock.patch.object(s3mirror, "MIN_MULTIPART_PART_SIZE", 1024)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    config = copy.deepcopy(s3mirror.DEFAULT_CONFIG)
+    config["performance"]["multipart_threshold"] = 1024
+    config["performance"]["multipart_chunksize"] = 1024
+    mirror = s3mirror.S3Mirror(config, logging.getLogger("test"))
+    mirror.source_client = source
+    mirror.dest_client = dest
+    return mirror
+
+
+class MultipartCopyTest(unittest.TestCase):
+    """Parallel ranged copies of large objects."""
+
+    def test_reads_are_pinned_to_listed_etag(self):
+        """Every ranged read carries the listed ETag as IfMatch."""
+        data = bytes(range(256)) * 20
+        source = RangedSource(data, '"v1"')
+        dest = MultipartDest()
+        mirror = make_multipart_mirror(self, source, dest)
+
+        self.assertTrue(mirror.copy_object("bucket", "key", len(data), '"v1"'))
+        self.assertTrue(dest.completed)
+        self.assertEqual(b"".join(dest.parts[n] for n in sorted(dest.parts)), data)
+        self.assertEqual({read["IfMatch"] for read in source.reads}, {'"v1"'})
+
+    def test_small_chunksize_is_raised_to_minimum(self):
+        """Chunk sizes below S3's minimum part size are raised to it."""
+        config = copy.deepcopy(s3mirror.DEFAULT_CONFIG)
+        config["performance"]["multipart_chunksize"] = 1024 * 1024
+        mirror = s3mirror.S3Mirror(config, logging.getLogger("test"))
+        # pylint: disable-next=protected-access
+        ranges = list(mirror._part_ranges(100 * 1024 * 1024))
+        self.assertEqual(len(ranges), 20)
+        self.assertEqual(ranges[0], (0, s3mirror.MIN_MULTIPART_PART_SIZE - 1))
+
+    def test_replaced_source_aborts_upload(self):
+        """A source overwritten since listing fails the copy and aborts."""
+        source = RangedSource(b"x" * 5000, '"v2"')
+        dest = MultipartDest()
+        mirror = make_multipart_mirror(self, source, dest)
+
+        self.assertFalse(mirror.copy_object("bucket", "key", 5000, '"v1"'))
+        self.assertTrue(dest.aborted)
+        self.assertFalse(dest.completed)
+
+
+class AdaptiveLimiterTest(unittest.TestCase):
+    """Request-level back-off on throttling."""
+
+    def test_throttling_halves_requests_in_flight(self):
+        """The cut is relative to requests in flight, not the starting limit."""
+        limiter = s3mirror.AdaptiveLimiter(200)
+        with contextlib.ExitStack() as stack:
+            for _ in range(120):
+                stack.enter_context(limiter)
+            cuts = [limiter.throttled() for _ in range(s3mirror.THROTTLE_THRESHOLD)]
+        self.assertTrue(cuts[-1])
+        self.assertEqual(limiter.limit, 60)
+
+    def test_throttling_without_requests_in_flight(self):
+        """Throttles seen while few requests run cut the limit to a quarter."""
+        for held in (0, 1):
+            with self.subTest(held=held):
+                limiter = s3mirror.AdaptiveLimiter(224)
+                with contextlib.ExitStack() as stack:
+                    for _ in range(held):
+                        stack.enter_context(limiter)
+                    for _ in range(s3mirror.THROTTLE_THRESHOLD):
+                        limiter.throttled()
+                self.assertEqual(limiter.limit, 56)
+
+    def test_one_cut_per_window(self):
+        """Serial throttles keep arriving after a cut without cutting again."""
+        limiter = s3mirror.AdaptiveLimiter(224)
+        with limiter:
+            cuts = [
+                limiter.throttled() for _ in range(4 * s3mirror.THROTTLE_THRESHOLD)
+            ]
+        self.assertEqual(cuts.count(True), 1)
+        self.assertEqual(limiter.limit, 56)
+
+    def test_limit_bounds_part_requests(self):
+        """Parts of a multipart copy each take a slot of the limiter."""
+        data = b"x" * 20 * 1024
+        dest = MultipartDest(delay=0.01)
+        mirror = make_multipart_mirror(self, RangedSource(data, '"v1"'), dest)
+        mirror._limiter.limit = 2  # pylint: disable=protected-access
+
+        self.assertTrue(mirror.copy_object("bucket", "key", len(data), '"v1"'))
+        self.assertTrue(dest.completed)
+        self.assertLessEqual(dest.peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()